@@ -33,7 +33,8 @@ REQUIRED = [
     'scikit-learn>=0.19.1',
     'flask>=0.12.2',
     'GPyOpt>=1.2.5',
-    'matplotlib'
+    'matplotlib',
+    'pyarrow'
 ]
 
 if sys.version_info > (3, 4):
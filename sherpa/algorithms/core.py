@@ -247,11 +247,13 @@ class RandomSearch(Algorithm):
     allows_repetition = True
 
     def __init__(self, max_num_trials=None):
-        self.max_num_trials = max_num_trials or 2**32  # total number of configs to be sampled
+        # total number of configs to be sampled, None means unlimited
+        self.max_num_trials = max_num_trials
         self.count = 0
 
     def get_suggestion(self, parameters, results=None, lower_is_better=True):
-        if self.count >= self.max_num_trials:
+        if self.max_num_trials is not None \
+                and self.count >= self.max_num_trials:
             return AlgorithmState.DONE
         else:
             self.count += 1
@@ -525,6 +527,37 @@ class MedianStoppingRule(StoppingRule):
     def __init__(self, min_iterations=0, min_trials=1):
         self.min_iterations = min_iterations
         self.min_trials = min_trials
+        self._per_trial_cache = None
+
+    def _get_per_trial_stats(self, results, lower_is_better):
+        """
+        Returns the maximum iteration and best objective per trial.
+
+        Computed with a single groupby over the results and cached until
+        new rows arrive, since the rule is evaluated once per active trial
+        against the same results-table.
+
+        Args:
+            results (pandas.DataFrame): all results so far.
+            lower_is_better (bool): whether lower objective values are better.
+
+        Returns:
+            pandas.DataFrame: indexed by Trial-ID with columns
+                max_iteration and objective.
+        """
+        # Key on the last row in addition to the length so that a rule
+        # instance handed a different results frame (e.g. when reused for
+        # another study) does not return stale statistics.
+        key = (len(results), lower_is_better,
+               results['Trial-ID'].iat[-1], results['Iteration'].iat[-1])
+        if self._per_trial_cache is not None \
+                and self._per_trial_cache[0] == key:
+            return self._per_trial_cache[1]
+        stats = results.groupby('Trial-ID').agg(
+            max_iteration=('Iteration', 'max'),
+            objective=('Objective', 'min' if lower_is_better else 'max'))
+        self._per_trial_cache = (key, stats)
+        return stats
 
     def should_trial_stop(self, trial, results, lower_is_better):
         """
@@ -538,32 +571,23 @@ class MedianStoppingRule(StoppingRule):
         """
         if len(results) == 0:
             return False
-        
-        trial_rows = results.loc[results['Trial-ID'] == trial.id]
-        
-        max_iteration = trial_rows['Iteration'].max()
-        if max_iteration < self.min_iterations:
-            return False
-        
-        trial_obj_val = trial_rows['Objective'].min() if lower_is_better else trial_rows['Objective'].max()
 
-        if numpy.isnan(trial_obj_val) and not trial_rows.empty:
-            alglogger.debug("Value {} is NaN: {}, trial rows: {}".format(trial_obj_val, numpy.isnan(trial_obj_val), trial_rows))
-            return True
+        stats = self._get_per_trial_stats(results, lower_is_better)
 
-        other_trial_ids = set(results['Trial-ID']) - {trial.id}
-        comparison_vals = []
-
-        for tid in other_trial_ids:
-            trial_rows = results.loc[results['Trial-ID'] == tid]
-            
-            max_iteration = trial_rows['Iteration'].max()
-            if max_iteration < self.min_iterations:
-                continue
+        if trial.id in stats.index:
+            if stats.at[trial.id, 'max_iteration'] < self.min_iterations:
+                return False
+            trial_obj_val = stats.at[trial.id, 'objective']
+            if numpy.isnan(trial_obj_val):
+                alglogger.debug("Trial {} only has NaN objective "
+                                "values.".format(trial.id))
+                return True
+        else:
+            trial_obj_val = numpy.nan
 
-            valid_rows = trial_rows.loc[trial_rows['Iteration'] <= max_iteration]
-            obj_val = valid_rows['Objective'].min() if lower_is_better else valid_rows['Objective'].max()
-            comparison_vals.append(obj_val)
+        others = stats.drop(index=trial.id, errors='ignore')
+        comparison_vals = others.loc[
+            others['max_iteration'] >= self.min_iterations, 'objective']
 
         if len(comparison_vals) < self.min_trials:
             return False
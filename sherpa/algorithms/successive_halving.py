@@ -117,8 +117,16 @@ class SuccessiveHalving(Algorithm):
         rung_results = SuccessiveHalving._get_completed_results(results, rung)
 
         n = len(rung_results) // eta
-        top_n = rung_results.sort_values(by="Objective",
-                                         ascending=lower_is_better) \
-                            .iloc[0:n, :] \
-                            .loc[:, columns]
+        if n == 0:
+            return rung_results.iloc[0:0].loc[:, columns]
+
+        # Select the n best rows via argpartition (O(N)) instead of sorting
+        # the whole rung; only the selected rows are then ordered. NaNs are
+        # placed last as with sort_values.
+        objective = rung_results["Objective"].values
+        if not lower_is_better:
+            objective = -objective
+        best = numpy.argpartition(objective, n - 1)[:n]
+        best = best[numpy.argsort(objective[best])]
+        top_n = rung_results.iloc[best].loc[:, columns]
         return top_n
@@ -43,7 +43,7 @@ def index():
         return render_template("index.html",
                                active_trials=active_trials,
                                parameter_types=app.parameter_types,
-                               results=[row.to_dict() for idx, row in results.iterrows()])
+                               results=results.to_dict('records'))
     else:
         return render_template("index.html",
                                active_trials=[],
@@ -30,6 +30,7 @@ import multiprocessing
 import warnings
 import contextlib
 import shlex
+from concurrent.futures import ThreadPoolExecutor
 from .database import _Database
 from .schedulers import _JobStatus
 import datetime
@@ -80,7 +81,7 @@ class Study(object):
         dashboard_port (int): the port for the dashboard web-server, if ``None``
             the first free port in the range `8880` to `9999` is found and used.
         disable_dashboard (bool): option to not run the dashboard.
-        output_dir (str): directory path for CSV results.
+        output_dir (str): directory path for the results store.
         random_seed (int): seed to use for NumPy random number generators
             throughout.
 
@@ -118,10 +119,61 @@ class Study(object):
         else:
             self.dashboard_process = None
 
+    @property
+    def results(self):
+        """
+        pandas.DataFrame: the results-table with one row per observation.
+        """
+        self._materialize()
+        return self._results
+
+    @results.setter
+    def results(self, results):
+        self._results = results
+        self._pending_rows = []
+        if ('Trial-ID' in results.columns
+                and 'Iteration' in results.columns):
+            self._result_keys = set(zip(results['Trial-ID'],
+                                        results['Iteration']))
+        else:
+            self._result_keys = set()
+        self._best_result_cache = None
+
+    def _materialize(self):
+        """
+        Appends buffered observations to the results-table.
+
+        Observations are buffered by ``add_observation`` and turned into rows
+        here via a single ``pandas.concat``, so the table is copied once per
+        batch rather than once per observation.
+        """
+        if not self._pending_rows:
+            return
+        # Transpose the buffered rows into one list per column so the batch
+        # frame is built column-wise; missing entries (e.g. a context metric
+        # only some trials report) are padded with NaN like before.
+        columns = collections.OrderedDict()
+        for row in self._pending_rows:
+            for key in row:
+                columns.setdefault(key, [])
+        for row in self._pending_rows:
+            for key, values in columns.items():
+                values.append(row.get(key, numpy.nan))
+        new_rows = pandas.DataFrame(columns)
+        self._pending_rows = []
+        if self._results.empty:
+            self._results = new_rows
+        else:
+            self._results = pandas.concat([self._results, new_rows],
+                                          ignore_index=True, sort=False)
+
+        if self.dashboard_process:
+            self._results_channel.df = self._results
+
     def add_observation(self, trial, objective, iteration=1, context={}):
         """
         Add a single observation of the objective value for a given trial.
-        
+
         Args:
             trial (sherpa.core.Trial): trial for which an observation is to be
                 added.
@@ -130,9 +182,7 @@ class Study(object):
             context (dict): other metrics or values to record.
         """
         assert isinstance(trial, Trial), "Trial must be sherpa.core.Trial"
-        if not self.results.empty and\
-                ((self.results['Trial-ID'] == trial.id)
-                     & (self.results['Iteration'] == iteration)).any():
+        if (trial.id, iteration) in self._result_keys:
             raise ValueError("Observation for Trial-ID {} at Iteration {} "
                              "already exists.".format(trial.id, iteration))
         if not all(p.name in trial.parameters for p in self.parameters):
@@ -153,13 +203,14 @@ class Study(object):
         row += [('Objective', objective)]
         row += sorted(context.items(), key=lambda t: t[0])
 
-        # Use ordered dict to maintain order
-        row = collections.OrderedDict([(key, [value]) for key, value in row])
-        self.results = self.results.append(pandas.DataFrame.from_dict(row),
-                                           ignore_index=True)
+        # Use ordered dict to maintain order, buffer until the table is read
+        self._pending_rows.append(collections.OrderedDict(row))
+        self._result_keys.add((trial.id, iteration))
 
         if self.dashboard_process:
-            self._results_channel.df = self.results
+            # The dashboard plots per-iteration progress, so push every
+            # observation; buffering only pays off without a dashboard.
+            self._materialize()
 
     def finalize(self, trial, status='COMPLETED'):
         """
@@ -191,10 +242,11 @@ class Study(object):
                           "encountered.".format(trial.id), RuntimeWarning)
             return
 
-        # Set status and append
-        best_row['Status'] = status
-        best_row['Iteration'] = rows['Iteration'].max()
-        self.results = self.results.append(best_row, ignore_index=True)
+        # Set status and append via the observation buffer
+        best_row.at['Status'] = status
+        best_row.at['Iteration'] = rows['Iteration'].max()
+        self._pending_rows.append(collections.OrderedDict(best_row.items()))
+        self._result_keys.add((trial.id, best_row.at['Iteration']))
 
         if self.dashboard_process:
             self._results_channel.df = self.results
@@ -265,16 +317,25 @@ class Study(object):
     def get_best_result(self):
         """
         Retrieve the best result so far.
-        
+
+        The result is cached and only recomputed once new observations have
+        been added to the results-table.
+
         Returns:
             pandas.DataFrame: row of the best result.
         """
-        if self.results.empty:
+        results = self.results
+        if results.empty:
             return {}
-        return self.algorithm.get_best_result(parameters=self.parameters,
-                                              results=self.results,
-                                              lower_is_better=
-                                              self.lower_is_better)
+        if (self._best_result_cache is not None
+                and self._best_result_cache[0] == len(results)):
+            return self._best_result_cache[1]
+        best_result = self.algorithm.get_best_result(parameters=self.parameters,
+                                                     results=results,
+                                                     lower_is_better=
+                                                     self.lower_is_better)
+        self._best_result_cache = (len(results), best_result)
+        return best_result
         
     def _run_web_server(self, port):
         """
@@ -320,11 +381,15 @@ class Study(object):
 
     def save(self, output_dir=None):
         """
-        Stores results to CSV and attributes to config file.
+        Stores results to disk and attributes to config file.
+
+        The results-table is stored as a feather file, which is much faster
+        to read and write than CSV and preserves column types. Use
+        ``export_csv`` to obtain a human-readable copy.
 
         Args:
-            output_dir (str): directory to store CSV to, only needed if Study
-                output_dir is not defined.
+            output_dir (str): directory to store results to, only needed if
+                Study output_dir is not defined.
 
         """
         if not output_dir:
@@ -338,8 +403,63 @@ class Study(object):
         with open(os.path.join(d, 'config.pkl'), 'wb') as f:
             pickle.dump(cfg, f)
 
-        self.results.to_csv(os.path.join(self.output_dir or output_dir,
-                                         'results.csv'), index=False)
+        results = self.results
+        if not results.empty:
+            store_path = os.path.join(d, 'results.feather')
+            try:
+                results.reset_index(drop=True).to_feather(store_path)
+            except ValueError:
+                # Mixed-type columns (e.g. a Choice over int and str values)
+                # cannot be represented in feather; fall back to CSV and
+                # drop any stale feather store so loading prefers the CSV.
+                results.to_csv(os.path.join(d, 'results.csv'), index=False)
+                if os.path.isfile(store_path):
+                    os.remove(store_path)
+
+    def export_csv(self, output_dir=None):
+        """
+        Writes the results-table to CSV for human inspection.
+
+        Args:
+            output_dir (str): directory to store the CSV to, only needed if
+                Study output_dir is not defined.
+        """
+        if not output_dir:
+            assert self.output_dir, "If no output-directory is specified, " \
+                                    "a directory needs to be passed as argument"
+        d = self.output_dir or output_dir
+        self.results.to_csv(os.path.join(d, 'results.csv'), index=False)
+
+    def load(self, output_dir=None):
+        """
+        Loads a previously saved study to continue its optimization.
+
+        The results-table is only parsed if a results store exists in the
+        output dir; a study that was never saved keeps its empty table.
+
+        Args:
+            output_dir (str): directory the study was saved to, only needed
+                if Study output_dir is not defined.
+        """
+        if not output_dir:
+            assert self.output_dir, "If no output-directory is specified, " \
+                                    "a directory needs to be passed as argument"
+        d = self.output_dir or output_dir
+        cfg = _load_config(os.path.join(d, 'config.pkl'))
+        self.num_trials = cfg['num_trials']
+
+        store_path = os.path.join(d, 'results.feather')
+        csv_path = os.path.join(d, 'results.csv')
+        if os.path.isfile(store_path):
+            self.results = pandas.read_feather(store_path)
+        elif os.path.isfile(csv_path):
+            self.results = pandas.read_csv(csv_path)
+
+        if self.algorithm:
+            self.algorithm.load(self.num_trials)
+
+        if self.dashboard_process:
+            self._results_channel.df = self.results
 
     @staticmethod
     def load_dashboard(path):
@@ -353,15 +473,37 @@ class Study(object):
             sherpa.core.Study: the study running the dashboard, note that
                 currently this study cannot be used to continue the optimization.
         """
-        with open(os.path.join(path, 'config.pkl'), 'rb') as f:
-            cfg = pickle.load(f)
+        cfg = _load_config(os.path.join(path, 'config.pkl'))
 
         s = Study(parameters=cfg['parameters'],
                   lower_is_better=cfg['lower_is_better'],
                   algorithm=None, output_dir=path)
 
-        results_path = os.path.join(path, 'results.csv')
-        s.results = pandas.read_csv(results_path)
+        store_path = os.path.join(path, 'results.feather')
+        if os.path.isfile(store_path):
+            s.results = pandas.read_feather(store_path)
+        else:
+            # Studies saved by earlier versions stored their results as CSV.
+            # Known column types are passed explicitly so that read_csv can
+            # skip its type-inference pass. Only Continuous/Discrete columns
+            # are guaranteed numeric; Choice/Ordinal may mix types and are
+            # left to inference.
+            dtypes = {'Trial-ID': 'int64',
+                      'Iteration': 'int64',
+                      'Objective': 'float64'}
+            for p in cfg['parameters']:
+                if isinstance(p, Discrete):
+                    dtypes[p.name] = 'int64'
+                elif isinstance(p, Continuous):
+                    dtypes[p.name] = 'float64'
+            s.results = pandas.read_csv(os.path.join(path, 'results.csv'),
+                                        dtype=dtypes, engine='c',
+                                        memory_map=True)
+
+        if 'Status' in s.results.columns:
+            # Status only takes the four trial-status values; storing the
+            # dashboard copy as categorical cuts its memory footprint.
+            s.results['Status'] = s.results['Status'].astype('category')
         s.num_trials = cfg['num_trials']
         s._results_channel.df = s.results
         return s
@@ -459,41 +601,57 @@ class _Runner(object):
                              "(1)\toutput_dir is empty\n"
                              "(2)\tno other database is running on this port.")
 
+        # Build the set of collected (Trial-ID, Iteration) pairs once instead
+        # of re-scanning the results-table for every row from the database.
+        try:
+            collected = set(zip(self.study.results['Trial-ID'],
+                                self.study.results['Iteration']))
+        except KeyError:
+            collected = set()
+
         for r in results:
-            try:
-                # Check if trial has already been collected.
-                new_trial = (r.get('trial_id') not in
-                             set(self.study.results['Trial-ID']))
-            except KeyError:
-                new_trial = True
-
-            if not new_trial:
-                trial_idxs = self.study.results['Trial-ID'] == r.get('trial_id')
-                trial_rows = self.study.results[trial_idxs]
-                new_observation = (r.get('iteration') not in
-                                   set(trial_rows['Iteration']))
-            else:
-                new_observation = True
+            key = (r.get('trial_id'), r.get('iteration'))
+            if key in collected:
+                continue
+            collected.add(key)
 
-            if new_trial or new_observation:
-                # Retrieve the Trial object
-                tid = r.get('trial_id')
-                tdict = self._all_trials[tid]
-                t = tdict.get('trial')
+            # Retrieve the Trial object
+            tid = r.get('trial_id')
+            tdict = self._all_trials[tid]
+            t = tdict.get('trial')
 
-                self.study.add_observation(trial=t,
-                                           iteration=r.get('iteration'),
-                                           objective=r.get('objective'),
-                                           context=r.get('context'))
+            self.study.add_observation(trial=t,
+                                       iteration=r.get('iteration'),
+                                       objective=r.get('objective'),
+                                       context=r.get('context'))
 
     def update_active_trials(self):
         """
         Update active trials, finalize any completed/stopped/failed trials.
         """
+        if not self._active_trials:
+            return
+        logger.debug('Updating active trials.')
+
+        # Status look-ups go to the scheduler (e.g. a qstat round-trip per
+        # job) and are independent of each other, so fetch them concurrently
+        # where the scheduler supports it; DRMAA-backed schedulers only
+        # allow one active session per process and are polled sequentially.
+        job_ids = [self._all_trials[tid].get('job_id')
+                   for tid in self._active_trials]
+        if (len(job_ids) > 1
+                and getattr(self.scheduler, 'supports_concurrent_status',
+                            False)):
+            with ThreadPoolExecutor(max_workers=min(len(job_ids), 8)) as ex:
+                statuses = list(ex.map(self.scheduler.get_status, job_ids))
+        else:
+            statuses = [self.scheduler.get_status(job_id)
+                        for job_id in job_ids]
+
+        num_finalized = 0
         for i in reversed(range(len(self._active_trials))):
             tid = self._active_trials[i]
-            logger.debug('Updating active trials.')
-            status = self.scheduler.get_status(self._all_trials[tid].get('job_id'))
+            status = statuses[i]
 
             if status in [_JobStatus.finished, _JobStatus.failed,
                           _JobStatus.killed, _JobStatus.other]:
@@ -503,7 +661,7 @@ class _Runner(object):
                 try:
                     self.study.finalize(trial=self._all_trials[tid].get('trial'),
                                         status=self._trial_status[status])
-                    self.study.save()
+                    num_finalized += 1
 
                 except ValueError as e:
                     warn_msg = str(e)
@@ -519,6 +677,11 @@ class _Runner(object):
                         self.study.add_trial(self._all_trials[tid].get('trial'))
                 self._active_trials.pop(i)
 
+        # Write the study to disk once per update instead of once per
+        # finalized trial.
+        if num_finalized > 0:
+            self.study.save()
+
     def stop_bad_performers(self):
         """
         Check whether any of the running trials should stop and add them for
@@ -548,10 +711,12 @@ class _Runner(object):
             if next_trial == AlgorithmState.WAIT:
                 break
             
-            submit_msg = "\n" + "-"*55 + "\n" + "Submitting Trial {}:\n".format(next_trial.id)
-            for pname, pval in next_trial.parameters.items():
-                submit_msg += "\t{0:15}={1:>31}\n".format(str(pname), str(pval))
-            submit_msg += "-"*55 + "\n"
+            submit_msg = "".join(
+                ["\n", "-"*55, "\n",
+                 "Submitting Trial {}:\n".format(next_trial.id)]
+                + ["\t{0:15}={1:>31}\n".format(str(pname), str(pval))
+                   for pname, pval in next_trial.parameters.items()]
+                + ["-"*55, "\n"])
             logger.info(submit_msg)
 
             self.database.enqueue_trial(next_trial)
@@ -612,12 +777,12 @@ def optimize(parameters, algorithm, lower_is_better,
         dashboard_port (int): port to run the dashboard web-server on.
         resubmit_failed_trials (bool): whether to resubmit a trial if it failed.
         verbose (int, default=1): whether to print submit messages (0=no, 1=yes).
-        load (bool): option to load study, currently not fully implemented.
+        load (bool): option to load a previously saved study from the
+            output_dir and continue it.
         mongodb_args (dict[str, any]): arguments to MongoDB beyond port, dir,
             and log-path. Keys are the argument name without "--".
     """
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     if not scheduler.output_dir:
         scheduler.output_dir = output_dir
@@ -669,6 +834,31 @@ def run_dashboard(path):
     s = Study.load_dashboard(path)
 
 
+_config_cache = {}
+
+
+def _load_config(path):
+    """
+    Helper function to load a pickled study config.
+
+    The config is memoized on path and modification time, so repeated loads
+    of the same file (e.g. reopening a dashboard) skip the unpickling.
+
+    Args:
+        path (str): path to the config pickle.
+
+    Returns:
+        dict: the study configuration.
+    """
+    key = (path, os.path.getmtime(path))
+    if key not in _config_cache:
+        with open(path, 'rb') as f:
+            cfg = pickle.load(f)
+        _config_cache.clear()
+        _config_cache[key] = cfg
+    return _config_cache[key]
+
+
 def _port_finder(start, end):
     """
     Helper function to find free port in range.
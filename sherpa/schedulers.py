@@ -44,6 +44,11 @@ class Scheduler(object):
     The job scheduler gives an API to submit jobs, retrieve statuses of specific
     jobs, and kill a job.
     """
+    # Whether get_status may be called from several threads at once. DRMAA
+    # based schedulers must keep this False since DRMAA v1 only allows one
+    # active session per process.
+    supports_concurrent_status = False
+
     def __init__(self):
         pass
 
@@ -93,9 +98,11 @@ class LocalScheduler(Scheduler):
     Args:
         submit_options (str): options appended before the command.
         resources (list[str]): list of resources that will be passed as
-            SHERPA_RESOURCE environment variable. If no resource is 
+            SHERPA_RESOURCE environment variable. If no resource is
             available '' will be passed.
     """
+    supports_concurrent_status = True
+
     def __init__(self, submit_options='', output_dir='', resources=None):
         self.output_dir = output_dir
         self.jobs = {}
@@ -109,10 +116,9 @@ class LocalScheduler(Scheduler):
 
     def submit_job(self, command, env={}, job_name=''):
         outdir = os.path.join(self.output_dir, 'jobs')
-        if not os.path.isdir(outdir):
-            os.mkdir(outdir)
+        os.makedirs(outdir, exist_ok=True)
             
-        env.update(os.environ.copy())
+        env.update(os.environ)
         if self.resources is not None:
             env['SHERPA_RESOURCE'] = str(self.resources.pop())
         else:
@@ -189,8 +195,7 @@ class SGEScheduler(Scheduler):
     def submit_job(self, command, env={}, job_name=''):
         # Create temp directory.
         outdir = os.path.join(self.output_dir, 'jobs')
-        if not os.path.isdir(outdir):
-            os.mkdir(outdir)
+        os.makedirs(outdir, exist_ok=True)
 
         job_name = job_name or str(self.count)
         sgeoutfile = os.path.join(outdir, '{}.out'.format(job_name))
@@ -322,8 +327,7 @@ class SLURMScheduler(Scheduler):
         logger.info('\nSUBMITTING JOB in submit_job')
 
         outdir = os.path.join(self.output_dir, 'jobs')
-        if not os.path.isdir(outdir):
-            os.mkdir(outdir)
+        os.makedirs(outdir, exist_ok=True)
 
         job_name = job_name or str(self.count)
         slurmoutfile = os.path.join(outdir, '{}.out'.format(job_name))
@@ -62,6 +62,30 @@ def test_runner_update_active_trials():
     assert r._active_trials == []
 
 
+def test_runner_update_active_trials_concurrent_polling():
+    mock_scheduler = mock.MagicMock()
+    mock_study = mock.MagicMock()
+
+    r = sherpa.core._Runner(study=mock_study, scheduler=mock_scheduler,
+                      database=mock.MagicMock(), max_concurrent=2,
+                      command=["python", "test.py"])
+
+    t1 = get_test_trial(1)
+    t2 = get_test_trial(2)
+    r._all_trials[t1.id] = {'trial': t1, 'job_id': 'job1'}
+    r._all_trials[t2.id] = {'trial': t2, 'job_id': 'job2'}
+    r._active_trials += [t1.id, t2.id]
+
+    statuses = {'job1': sherpa.schedulers._JobStatus.finished,
+                'job2': sherpa.schedulers._JobStatus.running}
+    mock_scheduler.get_status.side_effect = statuses.get
+    r.update_active_trials()
+
+    assert r._active_trials == [t2.id]
+    mock_study.finalize.assert_called_once_with(trial=t1, status='COMPLETED')
+    mock_study.save.assert_called_once_with()
+
+
 def test_runner_stop_bad_performers():
     r = sherpa.core._Runner(study=mock.MagicMock(),
                       scheduler=mock.MagicMock(),
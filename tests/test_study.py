@@ -17,6 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with SHERPA.  If not, see <http://www.gnu.org/licenses/>.
 """
+import os
 import pytest
 import sherpa
 import sherpa.core
@@ -86,6 +87,63 @@ def test_study_add_observation_with_iteration():
     assert s.results.equals(expected_df)
 
 
+def test_study_observations_buffered_in_order():
+    s = get_mock_study()
+    t = s.get_suggestion()
+    s.add_observation(trial=t, objective=0.1, iteration=1)
+    s.add_observation(trial=t, objective=0.01, iteration=2)
+    assert len(s._pending_rows) == 2
+
+    s.finalize(trial=t, status='COMPLETED')
+    assert list(s.results['Iteration']) == [1, 2, 2]
+    assert list(s.results['Status']) == ['INTERMEDIATE', 'INTERMEDIATE',
+                                         'COMPLETED']
+    assert s._pending_rows == []
+
+
+def test_study_save_load_round_trip(test_dir):
+    s = get_mock_study()
+    s.output_dir = test_dir
+    t = s.get_suggestion()
+    s.add_observation(trial=t, objective=0.1, iteration=1)
+    s.add_observation(trial=t, objective=0.01, iteration=2)
+    s.finalize(trial=t)
+    s.save()
+
+    s2 = get_mock_study()
+    s2.output_dir = test_dir
+    s2.load()
+    assert s2.num_trials == 1
+    assert s2.results.equals(s.results)
+    s2.algorithm.load.assert_called_with(1)
+
+
+def test_study_load_from_legacy_csv(test_dir):
+    s = get_mock_study()
+    s.output_dir = test_dir
+    t = s.get_suggestion()
+    s.add_observation(trial=t, objective=0.1, iteration=1)
+    s.finalize(trial=t)
+    s.save()
+    s.export_csv()
+    os.remove(os.path.join(test_dir, 'results.feather'))
+
+    s2 = get_mock_study()
+    s2.output_dir = test_dir
+    s2.load()
+    assert s2.results.equals(s.results)
+
+
+def test_study_export_csv(test_dir):
+    s = get_mock_study()
+    s.output_dir = test_dir
+    t = s.get_suggestion()
+    s.add_observation(trial=t, objective=0.1, iteration=1)
+    s.export_csv()
+    exported = pandas.read_csv(os.path.join(test_dir, 'results.csv'))
+    assert exported.equals(s.results)
+
+
 def test_study_add_observation_invalid_trial():
     s = get_mock_study()
     with pytest.raises(ValueError):